@@ -174,11 +174,11 @@ class OdfSlicerActor(vtk.vtkActor):
         all_faces = self._get_all_faces(len(offsets), len(sph_dirs))
         all_colors = self._generate_color_for_vertices(sf)
 
-        # TODO: There is a lot of deep copy here.
-        # Optimize (see viz_network.py example).
+        # vertices and colors are built for this polydata only,
+        # so VTK can share their memory instead of copying it.
         set_polydata_triangles(polydata, all_faces)
-        set_polydata_vertices(polydata, all_vertices)
-        set_polydata_colors(polydata, all_colors)
+        set_polydata_vertices(polydata, all_vertices, deep=False)
+        set_polydata_colors(polydata, all_colors, deep=False)
 
         self.mapper.SetInputData(polydata)
 
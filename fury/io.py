@@ -68,11 +68,10 @@ def load_image(filename, as_vtktype=False, use_pillow=True):
                                 0, 0)
             vtk_image.SetSpacing(1.0, 1.0, 1.0)
             vtk_image.SetOrigin(0.0, 0.0, 0.0)
-            arr_tmp = np.flipud(image)
-            arr_tmp = arr_tmp.reshape(image.shape[1] * image.shape[0], depth)
-            arr_tmp = np.ascontiguousarray(arr_tmp, dtype=image.dtype)
+            # arr_tmp is a fresh flipped copy, so VTK can keep it as is
+            arr_tmp = np.ascontiguousarray(image[::-1]).reshape(-1, depth)
             vtk_array_type = numpy_support.get_vtk_array_type(image.dtype)
-            uchar_array = numpy_support.numpy_to_vtk(arr_tmp, deep=True,
+            uchar_array = numpy_support.numpy_to_vtk(arr_tmp, deep=False,
                                                      array_type=vtk_array_type)
             vtk_image.GetPointData().SetScalars(uchar_array)
             image = vtk_image
@@ -45,7 +45,7 @@ def test_slicer(verbose=False):
     # window.show(scene)
 
     # copy pixels in numpy array directly
-    arr = window.snapshot(scene, 'test_slicer.png', offscreen=True)
+    arr = window.snapshot(scene, offscreen=True)
 
     if verbose:
         print(arr.sum())
@@ -195,8 +195,7 @@ def test_surface():
                                               colors=color, smooth=smooth_type)
                 scene.add(surface_actor)
                 # window.show(scene, size=(600, 600), reset_camera=False)
-                arr = window.snapshot(scene, 'test_surface.png',
-                                      offscreen=True)
+                arr = window.snapshot(scene, offscreen=True)
                 report = window.analyze_snapshot(arr, find_objects=True)
                 npt.assert_equal(report.objects, 1)
 
@@ -238,8 +237,8 @@ def test_contour_from_roi(interactive=False):
     if interactive:
         window.show(scene2)
 
-    arr = window.snapshot(scene, 'test_surface.png', offscreen=True)
-    arr2 = window.snapshot(scene2, 'test_surface2.png', offscreen=True)
+    arr = window.snapshot(scene, offscreen=True)
+    arr2 = window.snapshot(scene2, offscreen=True)
 
     report = window.analyze_snapshot(arr, find_objects=True)
     report2 = window.analyze_snapshot(arr2, find_objects=True)
@@ -300,11 +299,11 @@ def test_contour_from_roi(interactive=False):
         r = window.Scene()
         r2 = window.Scene()
         r.add(streamlines_actor)
-        arr3 = window.snapshot(r, 'test_surface3.png', offscreen=True)
+        arr3 = window.snapshot(r, offscreen=True)
         report3 = window.analyze_snapshot(arr3, find_objects=True)
         r2.add(streamlines_actor)
         r2.add(seedroi_actor)
-        arr4 = window.snapshot(r2, 'test_surface4.png', offscreen=True)
+        arr4 = window.snapshot(r2, offscreen=True)
         report4 = window.analyze_snapshot(arr4, find_objects=True)
 
         # assert that the seed ROI rendering is not far
@@ -362,9 +361,9 @@ def test_contour_from_label(interactive=False):
     if interactive:
         window.show(scene2)
 
-    arr = window.snapshot(scene, 'test_surface.png', offscreen=True,
+    arr = window.snapshot(scene, offscreen=True,
                           order_transparent=False)
-    arr2 = window.snapshot(scene2, 'test_surface2.png', offscreen=True,
+    arr2 = window.snapshot(scene2, offscreen=True,
                            order_transparent=True)
 
     report = window.analyze_snapshot(arr, colors=[(255, 0, 0),
@@ -1313,7 +1312,7 @@ def test_matplotlib_figure():
     scene.add(fig_actor2)
     ax_actor.SetPosition(-50, 500, -800)
     fig_actor2.SetPosition(500, 800, -400)
-    display = window.snapshot(scene, 'test_mpl.png', order_transparent=False,
+    display = window.snapshot(scene, order_transparent=False,
                               offscreen=True)
     res = window.analyze_snapshot(display, bg_color=(255, 255, 255.),
                                   colors=[(31, 119, 180)],
@@ -99,6 +99,30 @@ def test_polydata_polygon(interactive=False):
     normals = utils.get_polydata_normals(my_polydata)
     npt.assert_equal(len(normals), len(my_vertices))
 
+    # normals are kept as long as the geometry does not change
+    vtk_normals = my_polydata.GetPointData().GetNormals()
+    utils.update_polydata_normals(my_polydata)
+    npt.assert_equal(my_polydata.GetPointData().GetNormals() is vtk_normals,
+                     True)
+
+    # normals follow the geometry when it changes
+    res_vertices[:, 0] += res_vertices[:, 1]
+    my_polydata.GetPoints().GetData().Modified()
+    utils.update_polydata_normals(my_polydata)
+    new_normals = utils.get_polydata_normals(my_polydata)
+    npt.assert_equal(np.allclose(new_normals, normals), False)
+
+    # or when points created before the normals are set back
+    sheared_points = my_polydata.GetPoints()
+    utils.set_polydata_vertices(my_polydata, my_vertices)
+    utils.update_polydata_normals(my_polydata)
+    npt.assert_array_almost_equal(utils.get_polydata_normals(my_polydata),
+                                  normals)
+    my_polydata.SetPoints(sheared_points)
+    utils.update_polydata_normals(my_polydata)
+    npt.assert_array_almost_equal(utils.get_polydata_normals(my_polydata),
+                                  new_normals)
+
     mapper = utils.get_polymapper_from_polydata(my_polydata)
     actor1 = utils.get_actor_from_polymapper(mapper)
     actor2 = utils.get_actor_from_polydata(my_polydata)
@@ -303,6 +327,26 @@ def test_winding_order():
                      utils.fix_winding_order(vertices, triangles))
 
 
+def test_normals_from_v_f():
+
+    vertices = np.array([[0, 0, 0],
+                         [1, 0, 0],
+                         [0, 1, 0],
+                         [0, 0, 1]], dtype=float)
+
+    # vertex 0 is shared by both faces at the same position
+    triangles = np.array([[0, 1, 2],
+                          [0, 2, 3]])
+
+    expected_normals = np.array([[np.sqrt(.5), 0, np.sqrt(.5)],
+                                 [0, 0, 1],
+                                 [np.sqrt(.5), 0, np.sqrt(.5)],
+                                 [1, 0, 0]])
+
+    npt.assert_array_almost_equal(expected_normals,
+                                  utils.normals_from_v_f(vertices, triangles))
+
+
 def test_vertices_from_actor(interactive=False):
 
     expected = np.array([[1.5, -0.5, 0.],
@@ -247,12 +247,11 @@ def test_stereo():
 
     scene.reset_camera()
 
-    mono = window.snapshot(scene, fname='stereo_off.png', offscreen=True,
-                           size=(300, 300), stereo='off')
+    mono = window.snapshot(scene, offscreen=True, size=(300, 300),
+                           stereo='off')
 
     with npt.assert_warns(UserWarning):
-        stereo = window.snapshot(scene, fname='stereo_horizontal.png',
-                                 offscreen=True, size=(300, 300),
+        stereo = window.snapshot(scene, offscreen=True, size=(300, 300),
                                  stereo='On')
 
     # mono render should have values in the center
@@ -262,7 +261,9 @@ def test_stereo():
     npt.assert_array_equal(stereo[150, 150], [0, 0, 0])
 
 
-def test_record():
+def test_record(tmp_path, monkeypatch):
+    # window.record writes relative to the working directory
+    monkeypatch.chdir(tmp_path)
     xyzr = np.array([[0, 0, 0, 10], [100, 0, 0, 25], [200, 0, 0, 50]])
     colors = np.array([[1, 0, 0, 1], [0, 1, 0, 1], [0, 0, 1., 1]])
     sphere_actor = actor.sphere(centers=xyzr[:, :3], colors=colors[:],
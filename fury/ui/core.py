@@ -11,6 +11,27 @@ import vtk
 from fury.interactor import CustomInteractorStyle
 from fury.utils import set_input
 
+# Button states for which a mouse move is considered a drag.
+_PRESSING_OR_DRAGGING = frozenset(("pressing", "dragging"))
+
+
+# vtkTextProperty font and justification codes keyed by TextBlock2D's names,
+# and the reverse lookups used by the justification getters.
+_JUSTIFICATION = {'left': vtk.VTK_TEXT_LEFT,
+                  'center': vtk.VTK_TEXT_CENTERED,
+                  'right': vtk.VTK_TEXT_RIGHT}
+_VERTICAL_JUSTIFICATION = {'bottom': vtk.VTK_TEXT_BOTTOM,
+                           'middle': vtk.VTK_TEXT_CENTERED,
+                           'top': vtk.VTK_TEXT_TOP}
+_FONT_FAMILY = {'Arial': vtk.VTK_ARIAL, 'Courier': vtk.VTK_COURIER}
+_JUSTIFICATION_NAME = {v: k for k, v in _JUSTIFICATION.items()}
+_VERTICAL_JUSTIFICATION_NAME = {v: k for k, v in
+                                _VERTICAL_JUSTIFICATION.items()}
+
+
+def _noop_callback(i_ren, obj, element):
+    """Do nothing. Shared default for all the `on_*` UI callbacks."""
+
 
 class UI(object, metaclass=abc.ABCMeta):
     """An umbrella class for all UI elements.
@@ -89,22 +110,22 @@ class UI(object, metaclass=abc.ABCMeta):
         self.right_button_state = "released"
         self.middle_button_state = "released"
 
-        self.on_left_mouse_button_pressed = lambda i_ren, obj, element: None
-        self.on_left_mouse_button_dragged = lambda i_ren, obj, element: None
-        self.on_left_mouse_button_released = lambda i_ren, obj, element: None
-        self.on_left_mouse_button_clicked = lambda i_ren, obj, element: None
-        self.on_left_mouse_double_clicked = lambda i_ren, obj, element: None
-        self.on_right_mouse_button_pressed = lambda i_ren, obj, element: None
-        self.on_right_mouse_button_released = lambda i_ren, obj, element: None
-        self.on_right_mouse_button_clicked = lambda i_ren, obj, element: None
-        self.on_right_mouse_double_clicked = lambda i_ren, obj, element: None
-        self.on_right_mouse_button_dragged = lambda i_ren, obj, element: None
-        self.on_middle_mouse_button_pressed = lambda i_ren, obj, element: None
-        self.on_middle_mouse_button_released = lambda i_ren, obj, element: None
-        self.on_middle_mouse_button_clicked = lambda i_ren, obj, element: None
-        self.on_middle_mouse_double_clicked = lambda i_ren, obj, element: None
-        self.on_middle_mouse_button_dragged = lambda i_ren, obj, element: None
-        self.on_key_press = lambda i_ren, obj, element: None
+        self.on_left_mouse_button_pressed = _noop_callback
+        self.on_left_mouse_button_dragged = _noop_callback
+        self.on_left_mouse_button_released = _noop_callback
+        self.on_left_mouse_button_clicked = _noop_callback
+        self.on_left_mouse_double_clicked = _noop_callback
+        self.on_right_mouse_button_pressed = _noop_callback
+        self.on_right_mouse_button_released = _noop_callback
+        self.on_right_mouse_button_clicked = _noop_callback
+        self.on_right_mouse_double_clicked = _noop_callback
+        self.on_right_mouse_button_dragged = _noop_callback
+        self.on_middle_mouse_button_pressed = _noop_callback
+        self.on_middle_mouse_button_released = _noop_callback
+        self.on_middle_mouse_button_clicked = _noop_callback
+        self.on_middle_mouse_double_clicked = _noop_callback
+        self.on_middle_mouse_button_dragged = _noop_callback
+        self.on_key_press = _noop_callback
 
     @abc.abstractmethod
     def _setup(self):
@@ -234,9 +255,8 @@ class UI(object, metaclass=abc.ABCMeta):
             msg = "Subclasses of UI must implement the `size` property."
             raise NotImplementedError(msg)
 
-        new_center = np.array(coords)
-        size = np.array(self.size)
-        new_lower_left_corner = new_center - size / 2.
+        # `size` already returns a fresh array, no need to copy it again.
+        new_lower_left_corner = np.asarray(coords) - self.size / 2.
         self.position = new_lower_left_corner
 
     def set_visibility(self, visibility):
@@ -301,23 +321,13 @@ class UI(object, metaclass=abc.ABCMeta):
 
     @staticmethod
     def mouse_move_callback(i_ren, obj, self):
-        left_pressing_or_dragging = (self.left_button_state == "pressing" or
-                                     self.left_button_state == "dragging")
-
-        right_pressing_or_dragging = (self.right_button_state == "pressing" or
-                                      self.right_button_state == "dragging")
-
-        middle_pressing_or_dragging = \
-            (self.middle_button_state == "pressing" or
-             self.middle_button_state == "dragging")
-
-        if left_pressing_or_dragging:
+        if self.left_button_state in _PRESSING_OR_DRAGGING:
             self.left_button_state = "dragging"
             self.on_left_mouse_button_dragged(i_ren, obj, self)
-        elif right_pressing_or_dragging:
+        elif self.right_button_state in _PRESSING_OR_DRAGGING:
             self.right_button_state = "dragging"
             self.on_right_mouse_button_dragged(i_ren, obj, self)
-        elif middle_pressing_or_dragging:
+        elif self.middle_button_state in _PRESSING_OR_DRAGGING:
             self.middle_button_state = "dragging"
             self.on_middle_mouse_button_dragged(i_ren, obj, self)
 
@@ -403,11 +413,9 @@ class Rectangle2D(UI):
         scene.add(self.actor)
 
     def _get_size(self):
-        # Get 2D coordinates of two opposed corners of the rectangle.
-        lower_left_corner = np.array(self._points.GetPoint(0)[:2])
-        upper_right_corner = np.array(self._points.GetPoint(2)[:2])
-        size = abs(upper_right_corner - lower_left_corner)
-        return size
+        # The lower-left corner is always kept at the origin by `resize`, so
+        # the upper-right corner alone gives the size.
+        return np.abs(self._points.GetPoint(2)[:2])
 
     @property
     def width(self):
@@ -434,15 +442,18 @@ class Rectangle2D(UI):
             Button size (width, height) in pixels.
 
         """
+        # Nothing to do if the geometry already has this size, which avoids
+        # regenerating it on the next render.
+        if self._points.GetPoint(2)[:2] == (size[0], size[1]):
+            return
+
         self._points.SetPoint(0, 0, 0, 0.0)
         self._points.SetPoint(1, size[0], 0, 0.0)
         self._points.SetPoint(2, size[0], size[1], 0.0)
         self._points.SetPoint(3, 0, size[1], 0.0)
-        self._polygonPolyData.SetPoints(self._points)
-        mapper = vtk.vtkPolyDataMapper2D()
-        mapper = set_input(mapper, self._polygonPolyData)
-
-        self.actor.SetMapper(mapper)
+        # SetPoint does not bump the modification time; do it explicitly so
+        # the existing mapper picks up the new geometry on the next render.
+        self._points.Modified()
 
     def _set_position(self, coords):
         """Set the lower-left corner position of this UI component.
@@ -531,7 +542,8 @@ class Disk2D(UI):
         self._disk.SetCircumferentialResolution(50)
         self._disk.Update()
 
-        # Mapper
+        # Mapper. It is connected to the source's output port, so radius
+        # changes are only regenerated once, when the disk is next rendered.
         mapper = vtk.vtkPolyDataMapper2D()
         mapper = set_input(mapper, self._disk.GetOutputPort())
 
@@ -614,7 +626,6 @@ class Disk2D(UI):
     @inner_radius.setter
     def inner_radius(self, radius):
         self._disk.SetInnerRadius(radius)
-        self._disk.Update()
 
     @property
     def outer_radius(self):
@@ -623,7 +634,6 @@ class Disk2D(UI):
     @outer_radius.setter
     def outer_radius(self, radius):
         self._disk.SetOuterRadius(radius)
-        self._disk.Update()
 
 
 class TextBlock2D(UI):
@@ -825,13 +835,11 @@ class TextBlock2D(UI):
         family : str
             The font family.
         """
-        if family == 'Arial':
-            self.actor.GetTextProperty().SetFontFamilyToArial()
-        elif family == 'Courier':
-            self.actor.GetTextProperty().SetFontFamilyToCourier()
-        else:
+        if family not in _FONT_FAMILY:
             raise ValueError("Font not supported yet: {}.".format(family))
 
+        self.actor.GetTextProperty().SetFontFamily(_FONT_FAMILY[family])
+
     @property
     def justification(self):
         """Get text justification.
@@ -841,13 +849,8 @@ class TextBlock2D(UI):
         str
             Text justification.
         """
-        justification = self.actor.GetTextProperty().GetJustificationAsString()
-        if justification == 'Left':
-            return "left"
-        elif justification == 'Centered':
-            return "center"
-        elif justification == 'Right':
-            return "right"
+        justification = self.actor.GetTextProperty().GetJustification()
+        return _JUSTIFICATION_NAME.get(justification)
 
     @justification.setter
     def justification(self, justification):
@@ -859,17 +862,13 @@ class TextBlock2D(UI):
             Possible values are left, right, center.
 
         """
-        text_property = self.actor.GetTextProperty()
-        if justification == 'left':
-            text_property.SetJustificationToLeft()
-        elif justification == 'center':
-            text_property.SetJustificationToCentered()
-        elif justification == 'right':
-            text_property.SetJustificationToRight()
-        else:
+        if justification not in _JUSTIFICATION:
             msg = "Text can only be justified left, right and center."
             raise ValueError(msg)
 
+        text_property = self.actor.GetTextProperty()
+        text_property.SetJustification(_JUSTIFICATION[justification])
+
     @property
     def vertical_justification(self):
         """Get text vertical justification.
@@ -881,13 +880,8 @@ class TextBlock2D(UI):
 
         """
         text_property = self.actor.GetTextProperty()
-        vjustification = text_property.GetVerticalJustificationAsString()
-        if vjustification == 'Bottom':
-            return "bottom"
-        elif vjustification == 'Centered':
-            return "middle"
-        elif vjustification == 'Top':
-            return "top"
+        vjustification = text_property.GetVerticalJustification()
+        return _VERTICAL_JUSTIFICATION_NAME.get(vjustification)
 
     @vertical_justification.setter
     def vertical_justification(self, vertical_justification):
@@ -899,17 +893,14 @@ class TextBlock2D(UI):
             Possible values are bottom, middle, top.
 
         """
-        text_property = self.actor.GetTextProperty()
-        if vertical_justification == 'bottom':
-            text_property.SetVerticalJustificationToBottom()
-        elif vertical_justification == 'middle':
-            text_property.SetVerticalJustificationToCentered()
-        elif vertical_justification == 'top':
-            text_property.SetVerticalJustificationToTop()
-        else:
+        if vertical_justification not in _VERTICAL_JUSTIFICATION:
             msg = "Vertical justification must be: bottom, middle or top."
             raise ValueError(msg)
 
+        text_property = self.actor.GetTextProperty()
+        text_property.SetVerticalJustification(
+            _VERTICAL_JUSTIFICATION[vertical_justification])
+
     @property
     def bold(self):
         """Return whether the text is bold.
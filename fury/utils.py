@@ -50,12 +50,15 @@ def numpy_to_vtk_points(points):
     return vtk_points
 
 
-def numpy_to_vtk_colors(colors):
+def numpy_to_vtk_colors(colors, deep=True):
     """Convert Numpy color array to a vtk color array.
 
     Parameters
     ----------
     colors: ndarray
+    deep : bool, optional
+        If False and `colors` is already a contiguous uint8 array, VTK shares
+        its memory instead of copying it.
 
     Returns
     -------
@@ -73,11 +76,19 @@ def numpy_to_vtk_colors(colors):
     >>> vtk_colors = numpy_to_vtk_colors(255 * rgb_array)
 
     """
-    vtk_colors = numpy_support.numpy_to_vtk(np.asarray(colors), deep=True,
+    vtk_colors = numpy_support.numpy_to_vtk(np.asarray(colors), deep=deep,
                                             array_type=vtk.VTK_UNSIGNED_CHAR)
     return vtk_colors
 
 
+def _float_rgb_to_vtk_uchar(colors):
+    """Scale [0, 1] colors by 255 straight into a vtk unsigned char array."""
+    colors = np.asarray(colors)
+    uchar_colors = np.empty(colors.shape, dtype=np.uint8)
+    np.multiply(colors, 255, out=uchar_colors, casting='unsafe')
+    return numpy_to_vtk_colors(uchar_colors, deep=False)
+
+
 def numpy_to_vtk_cells(data, is_coords=True):
     """Convert numpy array to a vtk cell array.
 
@@ -94,28 +105,29 @@ def numpy_to_vtk_cells(data, is_coords=True):
         connectivity + offset information
 
     """
-    data = np.array(data, dtype=object)
     nb_cells = len(data)
-
-    # Get lines_array in vtk input format
-    connectivity = data.flatten() if not is_coords else []
-    offset = [0, ]
-    current_position = 0
-
     cell_array = vtk.vtkCellArray()
 
     if vtk.vtkVersion.GetVTKMajorVersion() >= 9:
-        for i in range(nb_cells):
-            current_len = len(data[i])
-            offset.append(offset[-1] + current_len)
-
-            if is_coords:
-                end_position = current_position + current_len
-                connectivity += list(range(current_position, end_position))
-                current_position = end_position
-
-        connectivity = np.array(connectivity, np.intp)
-        offset = np.array(offset, dtype=connectivity.dtype)
+        if isinstance(data, np.ndarray) and data.ndim >= 2:
+            # all cells have the same length, no need to look at each one
+            offset = np.arange(nb_cells + 1, dtype=np.intp) * data.shape[1]
+        else:
+            points_per_cell = np.fromiter((len(cell) for cell in data),
+                                          np.intp, count=nb_cells)
+            offset = np.empty(nb_cells + 1, dtype=np.intp)
+            offset[0] = 0
+            np.cumsum(points_per_cell, out=offset[1:])
+
+        if is_coords:
+            connectivity = np.arange(offset[-1], dtype=np.intp)
+        elif isinstance(data, np.ndarray) and data.ndim == 2:
+            connectivity = data.astype(np.intp).ravel()
+        elif nb_cells:
+            connectivity = np.concatenate(
+                [np.asarray(cell).ravel() for cell in data]).astype(np.intp)
+        else:
+            connectivity = np.empty(0, dtype=np.intp)
 
         vtk_array_type = numpy_support.get_vtk_array_type(connectivity.dtype)
         cell_array.SetData(
@@ -124,6 +136,9 @@ def numpy_to_vtk_cells(data, is_coords=True):
             numpy_support.numpy_to_vtk(connectivity, deep=True,
                                        array_type=vtk_array_type))
     else:
+        data = np.array(data, dtype=object)
+        connectivity = data.flatten() if not is_coords else []
+        current_position = 0
         for i in range(nb_cells):
             current_len = len(data[i])
             end_position = current_position + current_len
@@ -161,12 +176,13 @@ def map_coordinates_3d_4d(input_array, indices):
         return map_coordinates(input_array, indices.T, order=1)
 
     if input_array.ndim == 4:
-        values_4d = []
+        coords = indices.T
+        values_4d = np.empty((coords.shape[-1], input_array.shape[-1]),
+                             dtype=input_array.dtype)
         for i in range(input_array.shape[-1]):
-            values_tmp = map_coordinates(input_array[..., i],
-                                         indices.T, order=1)
-            values_4d.append(values_tmp)
-        return np.ascontiguousarray(np.array(values_4d).T)
+            map_coordinates(input_array[..., i], coords, order=1,
+                            output=values_4d[:, i])
+        return values_4d
 
 
 def lines_to_vtk_polydata(lines, colors=None):
@@ -223,18 +239,20 @@ def lines_to_vtk_polydata(lines, colors=None):
     nb_points = len(points_array)
     nb_lines = len(lines)
     lines_range = range(nb_lines)
-    points_per_line = [len(lines[i]) for i in lines_range]
-    points_per_line = np.array(points_per_line, np.intp)
+    points_per_line = np.fromiter(map(len, lines), np.intp, count=nb_lines)
     color_is_scalar = False
     if colors is None or colors is False:
         # set automatic rgb colors
         cols_arr = line_colors(lines)
         colors_mapper = np.repeat(lines_range, points_per_line, axis=0)
-        vtk_colors = numpy_to_vtk_colors(255 * cols_arr[colors_mapper])
+        # scale the per-line table before gathering it out to every point
+        cols_arr = (255 * cols_arr).astype(np.uint8)
+        vtk_colors = numpy_to_vtk_colors(cols_arr[colors_mapper],
+                                         deep=False)
     else:
         cols_arr = np.asarray(colors)
         if cols_arr.dtype == object:  # colors is a list of colors
-            vtk_colors = numpy_to_vtk_colors(255 * np.vstack(colors))
+            vtk_colors = _float_rgb_to_vtk_uchar(np.vstack(colors))
         else:
             if len(cols_arr) == nb_points:
                 if cols_arr.ndim == 1:  # values for every point
@@ -242,24 +260,25 @@ def lines_to_vtk_polydata(lines, colors=None):
                                                             deep=True)
                     color_is_scalar = True
                 elif cols_arr.ndim == 2:  # map color to each point
-                    vtk_colors = numpy_to_vtk_colors(255 * cols_arr)
+                    vtk_colors = _float_rgb_to_vtk_uchar(cols_arr)
 
             elif cols_arr.ndim == 1:
                 if len(cols_arr) == nb_lines:  # values for every streamline
-                    cols_arrx = []
-                    for (i, value) in enumerate(colors):
-                        cols_arrx += lines[i].shape[0]*[value]
-                    cols_arrx = np.array(cols_arrx)
+                    cols_arrx = np.repeat(cols_arr, points_per_line)
                     vtk_colors = numpy_support.numpy_to_vtk(cols_arrx,
                                                             deep=True)
                     color_is_scalar = True
                 else:  # the same colors for all points
-                    vtk_colors = numpy_to_vtk_colors(
-                        np.tile(255 * cols_arr, (nb_points, 1)))
+                    cols_arrx = np.empty((nb_points, len(cols_arr)),
+                                         dtype=np.uint8)
+                    cols_arrx[:] = 255 * cols_arr
+                    vtk_colors = numpy_to_vtk_colors(cols_arrx, deep=False)
 
             elif cols_arr.ndim == 2:  # map color to each line
                 colors_mapper = np.repeat(lines_range, points_per_line, axis=0)
-                vtk_colors = numpy_to_vtk_colors(255 * cols_arr[colors_mapper])
+                cols_arr = (255 * cols_arr).astype(np.uint8)
+                vtk_colors = numpy_to_vtk_colors(cols_arr[colors_mapper],
+                                                 deep=False)
             else:  # colormap
                 #  get colors for each vertex
                 cols_arr = map_coordinates_3d_4d(cols_arr, points_array)
@@ -286,6 +305,16 @@ def get_polydata_lines(line_polydata):
     """
     lines_vertices = numpy_support.vtk_to_numpy(line_polydata.GetPoints().
                                                 GetData())
+
+    if vtk.vtkVersion.GetVTKMajorVersion() >= 9:
+        vtk_lines = line_polydata.GetLines()
+        if vtk_lines.GetNumberOfCells() == 0:
+            return []
+        offsets = numpy_support.vtk_to_numpy(vtk_lines.GetOffsetsArray())
+        connectivity = numpy_support.vtk_to_numpy(
+            vtk_lines.GetConnectivityArray())
+        return np.split(lines_vertices[connectivity], offsets[1:-1])
+
     lines_idx = numpy_support.vtk_to_numpy(line_polydata.GetLines().GetData())
 
     lines = []
@@ -316,9 +345,9 @@ def get_polydata_triangles(polydata):
     """
     vtk_polys = numpy_support.vtk_to_numpy(polydata.GetPolys().GetData())
     # test if its really triangles
-    if not (vtk_polys[::4] == 3).all():
+    if vtk_polys.size % 4 or not (vtk_polys[::4] == 3).all():
         raise AssertionError("Shape error: this is not triangles")
-    return np.vstack([vtk_polys[1::4], vtk_polys[2::4], vtk_polys[3::4]]).T
+    return np.ascontiguousarray(vtk_polys.reshape(-1, 4)[:, 1:])
 
 
 def get_polydata_vertices(polydata):
@@ -388,10 +417,10 @@ def set_polydata_triangles(polydata, triangles):
         triangles, represented as 2D ndarrays (Nx3)
 
     """
-    vtk_cells = vtk.vtkCellArray()
     if vtk.vtkVersion.GetVTKMajorVersion() >= 9:
         vtk_cells = numpy_to_vtk_cells(triangles, is_coords=False)
     else:
+        vtk_cells = vtk.vtkCellArray()
         isize = vtk.vtkIdTypeArray().GetDataTypeSize()
         req_dtype = np.int32 if isize == 4 else np.int64
         all_triangles =\
@@ -403,36 +432,41 @@ def set_polydata_triangles(polydata, triangles):
     return polydata
 
 
-def set_polydata_vertices(polydata, vertices):
+def set_polydata_vertices(polydata, vertices, deep=True):
     """Set polydata vertices with a numpy array (ndarrays Nx3 int).
 
     Parameters
     ----------
     polydata : vtkPolyData
     vertices : vertices, represented as 2D ndarrays (Nx3)
+    deep : bool, optional
+        If False, VTK shares the memory of `vertices` instead of copying it.
+        `vertices` must then be C-contiguous and left unmodified.
 
     """
     vtk_points = vtk.vtkPoints()
-    vtk_points.SetData(numpy_support.numpy_to_vtk(vertices, deep=True))
+    vtk_points.SetData(numpy_support.numpy_to_vtk(vertices, deep=deep))
     polydata.SetPoints(vtk_points)
     return polydata
 
 
-def set_polydata_normals(polydata, normals):
+def set_polydata_normals(polydata, normals, deep=True):
     """Set polydata normals with a numpy array (ndarrays Nx3 int).
 
     Parameters
     ----------
     polydata : vtkPolyData
     normals : normals, represented as 2D ndarrays (Nx3) (one per vertex)
+    deep : bool, optional
+        If False, VTK shares the memory of `normals` instead of copying it.
 
     """
-    vtk_normals = numpy_support.numpy_to_vtk(normals, deep=True)
+    vtk_normals = numpy_support.numpy_to_vtk(normals, deep=deep)
     polydata.GetPointData().SetNormals(vtk_normals)
     return polydata
 
 
-def set_polydata_colors(polydata, colors, array_name="colors"):
+def set_polydata_colors(polydata, colors, array_name="colors", deep=True):
     """Set polydata colors with a numpy array (ndarrays Nx3 int).
 
     Parameters
@@ -440,9 +474,13 @@ def set_polydata_colors(polydata, colors, array_name="colors"):
     polydata : vtkPolyData
     colors : colors, represented as 2D ndarrays (Nx3)
         colors are uint8 [0,255] RGB for each points
+    array_name : str, optional
+    deep : bool, optional
+        If False and `colors` is already uint8, VTK shares its memory instead
+        of copying it.
 
     """
-    vtk_colors = numpy_support.numpy_to_vtk(colors, deep=True,
+    vtk_colors = numpy_support.numpy_to_vtk(colors, deep=deep,
                                             array_type=vtk.VTK_UNSIGNED_CHAR)
     nb_components = colors.shape[1]
     vtk_colors.SetNumberOfComponents(nb_components)
@@ -454,11 +492,27 @@ def set_polydata_colors(polydata, colors, array_name="colors"):
 def update_polydata_normals(polydata):
     """Generate and update polydata normals.
 
+    Normals are only regenerated if the points or the polygons of `polydata`
+    were modified, or replaced, since they were last generated.
+
     Parameters
     ----------
     polydata : vtkPolyData
 
     """
+    vtk_normals = polydata.GetPointData().GetNormals()
+    if vtk_normals is not None and vtk_normals.GetName() == 'Normals':
+        # vtkObject.GetMTime is the polydata's own time, bumped by SetPoints
+        # or SetPolys, without the point data holding the normals themselves
+        geometry_mtime = max(vtk.vtkObject.GetMTime(polydata),
+                             polydata.GetPoints().GetMTime(),
+                             polydata.GetPolys().GetMTime(),
+                             polydata.GetStrips().GetMTime())
+        if vtk_normals.GetMTime() > geometry_mtime:
+            return
+    # vtkPolyDataNormals passes existing normals through, drop the stale ones
+    polydata.GetPointData().SetNormals(None)
+
     normals_gen = set_input(vtk.vtkPolyDataNormals(), polydata)
     normals_gen.ComputePointNormalsOn()
     normals_gen.ComputeCellNormalsOn()
@@ -583,11 +637,12 @@ def repeat_sources(centers, colors, active_scalars=1., directions=None,
     if source is None and faces is None:
         raise IOError("A source or faces should be defined")
 
-    if np.array(colors).ndim == 1:
-        colors = np.tile(colors, (len(centers), 1))
+    colors = np.asarray(colors)
+    if colors.ndim == 1:
+        colors = np.broadcast_to(colors, (len(centers), len(colors)))
 
     pts = numpy_to_vtk_points(np.ascontiguousarray(centers))
-    cols = numpy_to_vtk_colors(255 * np.ascontiguousarray(colors))
+    cols = _float_rgb_to_vtk_uchar(colors)
     cols.SetName('colors')
     if isinstance(active_scalars, (float, int)):
         active_scalars = np.tile(active_scalars, (len(centers), 1))
@@ -705,7 +760,8 @@ def apply_affine(aff, pts):
     # rzs == rotations, zooms, shears
     rzs = aff[:-1, :-1]
     trans = aff[:-1, -1]
-    res = np.dot(pts, rzs.T) + trans[None, :]
+    res = np.dot(pts, rzs.T)
+    res += trans
     return res.reshape(shape)
 
 
@@ -724,12 +780,7 @@ def vtk_matrix_to_numpy(matrix):
     if isinstance(matrix, vtk.vtkMatrix3x3):
         size = (3, 3)
 
-    mat = np.zeros(size)
-    for i in range(mat.shape[0]):
-        for j in range(mat.shape[1]):
-            mat[i, j] = matrix.GetElement(i, j)
-
-    return mat
+    return np.array(matrix.GetData()).reshape(size)
 
 
 def numpy_to_vtk_matrix(array):
@@ -744,10 +795,7 @@ def numpy_to_vtk_matrix(array):
     else:
         raise ValueError("Invalid matrix shape: {0}".format(array.shape))
 
-    for i in range(array.shape[0]):
-        for j in range(array.shape[1]):
-            matrix.SetElement(i, j, array[i, j])
-
+    matrix.DeepCopy(np.ascontiguousarray(array, dtype=np.float64).ravel())
     return matrix
 
 
@@ -800,11 +848,15 @@ def get_grid_cells_position(shapes, aspect_ratio=16/9., dim=None):
         msg = "Size is too small, it cannot contain at least {} elements."
         raise ValueError(msg.format(count))
 
-    # Use indexing="xy" so the cells are in row-major (C-order). Also,
-    # the Y coordinates are negative so the cells are order from top to bottom.
-    X, Y, Z = np.meshgrid(np.arange(n_cols), -np.arange(n_rows),
-                          [0], indexing="xy")
-    return cell_shape * np.array([X.flatten(), Y.flatten(), Z.flatten()]).T
+    # Fill the cells in row-major (C-order). Also, the Y coordinates are
+    # negative so the cells are order from top to bottom.
+    cols = np.arange(n_cols)
+    rows = -np.arange(n_rows)
+    positions = np.zeros((len(rows) * len(cols), 3),
+                         dtype=np.result_type(cell_shape, cols, rows))
+    positions[:, 0] = np.tile(cols, len(rows)) * cell_shape[0]
+    positions[:, 1] = np.repeat(rows, len(cols)) * cell_shape[1]
+    return positions
 
 
 def shallow_copy(vtk_object):
@@ -828,15 +880,15 @@ def rotate(actor, rotation=(90, 1, 0, 0)):
     prop3D = actor
     center = np.array(prop3D.GetCenter())
 
-    oldMatrix = prop3D.GetMatrix()
     orig = np.array(prop3D.GetOrigin())
+    userMatrix = prop3D.GetUserMatrix()
 
     newTransform = vtk.vtkTransform()
     newTransform.PostMultiply()
-    if prop3D.GetUserMatrix() is not None:
-        newTransform.SetMatrix(prop3D.GetUserMatrix())
+    if userMatrix is not None:
+        newTransform.SetMatrix(userMatrix)
     else:
-        newTransform.SetMatrix(oldMatrix)
+        newTransform.SetMatrix(prop3D.GetMatrix())
 
     newTransform.Translate(*(-center))
     newTransform.RotateWXYZ(*rotation)
@@ -847,8 +899,8 @@ def rotate(actor, rotation=(90, 1, 0, 0)):
     newTransform.PreMultiply()
     newTransform.Translate(*orig)
 
-    if prop3D.GetUserMatrix() is not None:
-        newTransform.GetMatrix(prop3D.GetUserMatrix())
+    if userMatrix is not None:
+        newTransform.GetMatrix(userMatrix)
     else:
         prop3D.SetPosition(newTransform.GetPosition())
         prop3D.SetScale(newTransform.GetScale())
@@ -871,8 +923,9 @@ def rgb_to_vtk(data):
     grid = vtk.vtkImageData()
     grid.SetDimensions(data.shape[1], data.shape[0], 1)
     nd = data.shape[-1]
+    # rows bottom to top, each row from left to right, in one C-order copy
     vtkarr = numpy_support.numpy_to_vtk(
-        np.flip(data.swapaxes(0, 1), axis=1).reshape((-1, nd), order='F'))
+        np.ascontiguousarray(data[::-1]).reshape((-1, nd)))
     vtkarr.SetName('Image')
     grid.GetPointData().AddArray(vtkarr)
     grid.GetPointData().SetActiveScalars('Image')
@@ -892,11 +945,14 @@ def normalize_v3(arr):
     -------
     norm_array
 
+    Notes
+    -----
+    The array is normalized in place. Zero-length vectors are left unchanged.
+
     """
-    lens = np.sqrt(arr[:, 0] ** 2 + arr[:, 1] ** 2 + arr[:, 2] ** 2)
-    arr[:, 0] /= lens
-    arr[:, 1] /= lens
-    arr[:, 2] /= lens
+    lens = np.linalg.norm(arr, axis=1, keepdims=True)
+    lens[lens == 0] = 1
+    arr /= lens
     return arr
 
 
@@ -916,11 +972,12 @@ def normals_from_v_f(vertices, faces):
     """
     norm = np.zeros(vertices.shape, dtype=vertices.dtype)
     tris = vertices[faces]
-    n = np.cross(tris[::, 1] - tris[::, 0], tris[::, 2] - tris[::, 0])
+    # tris is a fresh copy, turn it into the two edge vectors in place
+    tris[:, 1:] -= tris[:, :1]
+    n = np.cross(tris[:, 1], tris[:, 2])
     normalize_v3(n)
-    norm[faces[:, 0]] += n
-    norm[faces[:, 1]] += n
-    norm[faces[:, 2]] += n
+    # unbuffered, so vertices shared by several faces get every contribution
+    np.add.at(norm, faces, n[:, None, :])
     normalize_v3(norm)
     return norm
 
@@ -947,13 +1004,11 @@ def triangle_order(vertices, faces):
     v3 = vertices[faces[2]]
 
     # https://stackoverflow.com/questions/40454789/computing-face-normals-and-winding
-    m_orient = np.ones((4, 4))
-    m_orient[0, :3] = v1
-    m_orient[1, :3] = v2
-    m_orient[2, :3] = v3
-    m_orient[3, :3] = 0
-
-    val = np.linalg.det(m_orient)
+    # The determinant of [[v1, 1], [v2, 1], [v3, 1], [0, 0, 0, 1]] expanded
+    # along its last row, i.e. the signed volume spanned by v1, v2 and v3.
+    val = v1[0] * (v2[1] * v3[2] - v2[2] * v3[1]) + \
+        v1[1] * (v2[2] * v3[0] - v2[0] * v3[2]) + \
+        v1[2] * (v2[0] * v3[1] - v2[1] * v3[0])
 
     return bool(val > 0)
 
@@ -1000,11 +1055,12 @@ def fix_winding_order(vertices, triangles, clockwise=False):
 
     """
     corrected_triangles = triangles.copy()
-    desired_order = clockwise
-    for nb, face in enumerate(triangles):
-        current_order = triangle_order(vertices, face)
-        if desired_order != current_order:
-            corrected_triangles[nb] = change_vertices_order(face)
+    tris = np.asarray(vertices)[triangles]
+    # Same sign test as `triangle_order`, for all the triangles at once
+    signed_volumes = np.einsum('ij,ij->i', tris[:, 0],
+                               np.cross(tris[:, 1], tris[:, 2]))
+    flip = (signed_volumes > 0) != clockwise
+    corrected_triangles[flip] = triangles[flip][:, ::-1]
     return corrected_triangles
 
 
@@ -1100,9 +1156,9 @@ def update_actor(actor, all_arrays=True):
     pd = actor.GetMapper().GetInput()
     pd.GetPoints().GetData().Modified()
     if all_arrays:
-        nb_array = pd.GetPointData().GetNumberOfArrays()
-        for i in range(nb_array):
-            pd.GetPointData().GetArray(i).Modified()
+        point_data = pd.GetPointData()
+        for i in range(point_data.GetNumberOfArrays()):
+            point_data.GetArray(i).Modified()
 
 
 def get_bounds(actor):